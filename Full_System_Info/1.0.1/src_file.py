@@ -7,14 +7,21 @@ Comprehensive system information inspector with a GUI (CustomTkinter preferred).
 - Export to text file (report).
 """
 
+import functools
+import heapq
+import importlib
+import io
 import threading
 import time
 import os
 import platform
+import queue
 import sys
 import socket
 import uuid
 import getpass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timedelta
 
 try:
@@ -22,15 +29,14 @@ try:
 except Exception:
     psutil = None
 
-try:
-    import cpuinfo
-except Exception:
-    cpuinfo = None
-
-try:
-    import GPUtil
-except Exception:
-    GPUtil = None
+# Prime the CPU counters so later non-blocking cpu_percent() calls
+# report usage since the previous call instead of a meaningless 0.0.
+if psutil:
+    try:
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+    except Exception:
+        pass
 
 try:
     import customtkinter as ctk
@@ -41,260 +47,532 @@ except Exception:
     from tkinter import scrolledtext, filedialog, messagebox
     UI_FRAMEWORK = "tk"
 
-def format_bytes(n):
-    for unit in ['B','KB','MB','GB','TB','PB']:
-        if abs(n) < 1024.0:
-            return f"{n:3.2f} {unit}"
-        n /= 1024.0
-    return f"{n:.2f} PB"
+_lazy_modules = {}
 
+def _lazy(name):
+    """Import an optional module on first use; None if it is unavailable."""
+    try:
+        return _lazy_modules[name]
+    except KeyError:
+        try:
+            mod = importlib.import_module(name)
+        except Exception:
+            mod = None
+        _lazy_modules[name] = mod
+        return mod
+
+def _ttl_cache(seconds):
+    """Cache the result of a no-argument function for `seconds`."""
+    def decorator(fn):
+        entry = [None]  # (expires_at, value), swapped atomically
+
+        @functools.wraps(fn)
+        def wrapper():
+            cached = entry[0]
+            now = time.monotonic()
+            if cached is not None and now < cached[0]:
+                return cached[1]
+            value = fn()
+            entry[0] = (now + seconds, value)
+            return value
+        return wrapper
+    return decorator
+
+_UNITS = ('B','KB','MB','GB','TB','PB')
+
+def format_bytes(n):
+    # bit_length picks the 1024-power directly instead of dividing in a loop.
+    idx = min(max(int(abs(n)).bit_length() - 1, 0) // 10, len(_UNITS) - 1)
+    return f"{n / (1 << (idx * 10)):3.2f} {_UNITS[idx]}"
+
+# Fixed-schema records passed from the collectors to the report.
+@dataclass(slots=True, frozen=True)
+class BasicInfo:
+    username: str
+    hostname: str
+    fqdn: str
+    platform: str
+    platform_release: str
+    platform_version: str
+    architecture: str
+    processor: str
+    python_version: str
+    boot_time: str
+
+@dataclass(slots=True)
+class CpuInfo:
+    brand: str = "N/A"
+    arch: str = "N/A"
+    bits: int | str = "N/A"
+    count_logical: int | str = "N/A"
+    count_physical: int | str = "N/A"
+    freq: float | str = "N/A"
+    usage_per_core: list = field(default_factory=list)
+    total_cpu_percent: float | str = "N/A"
+
+@dataclass(slots=True)
+class MemoryInfo:
+    total: str
+    available: str
+    used: str
+    percent: str
+    swap_total: str
+    swap_used: str
+    swap_percent: str
+
+_MEMORY_LABELS = tuple((f.name, f.name.replace('_',' ').title()) for f in fields(MemoryInfo))
+
+@dataclass(slots=True)
+class Partition:
+    device: str
+    mountpoint: str
+    fstype: str
+    opts: str
+    total: str
+    used: str
+    free: str
+    percent: str
+
+@dataclass(slots=True)
+class DiskInfo:
+    partitions: list = field(default_factory=list)
+    disk_io: object = None
+
+@dataclass(slots=True)
+class NetworkInfo:
+    hostname: str = "N/A"
+    local_ip: str = "N/A"
+    nic_lines: list = field(default_factory=list)
+    bytes_sent: str = "N/A"
+    bytes_recv: str = "N/A"
+
+@dataclass(slots=True)
+class GpuInfo:
+    id: int
+    name: str
+    load: str
+    memory_total: str
+    memory_used: str
+    temperature: str
+
+@dataclass(slots=True)
+class ProcessInfo:
+    pid: int
+    name: str
+    username: str | None
+    cpu_percent: float
+    memory_percent: float
+
+@dataclass(slots=True)
+class SystemInfo:
+    timestamp: str
+    basic: BasicInfo
+    uptime: str
+    cpu: CpuInfo
+    memory: MemoryInfo | None
+    disk: DiskInfo
+    network: NetworkInfo
+    gpu: list
+    top_processes: list
+
+_cpuinfo_lock = threading.Lock()
+
+def _cpuinfo():
+    """cpuinfo.get_cpu_info() probes the CPU and is slow; run it once."""
+    # get_basic_info and get_cpu_info can ask at the same moment from
+    # different threads; lru_cache alone would let both run the probe.
+    with _cpuinfo_lock:
+        return _probe_cpuinfo()
+
+@functools.lru_cache(maxsize=1)
+def _probe_cpuinfo():
+    return _lazy('cpuinfo').get_cpu_info()
+
+@functools.lru_cache(maxsize=1)
+def _boot_time():
+    return psutil.boot_time()
+
+@functools.lru_cache(maxsize=1)
 def get_basic_info():
-    info = {}
-    info['username'] = getpass.getuser()
-    info['hostname'] = socket.gethostname()
+    # None of these change while the process runs; the fqdn lookup alone
+    # can take seconds on a misconfigured resolver. BasicInfo is frozen,
+    # so the cached instance is safe to hand out.
     try:
-        info['fqdn'] = socket.getfqdn()
+        fqdn = socket.getfqdn()
     except Exception:
-        info['fqdn'] = "N/A"
-    info['platform'] = platform.system()
-    info['platform_release'] = platform.release()
-    info['platform_version'] = platform.version()
-    info['architecture'] = platform.machine()
-    info['processor'] = platform.processor() or ("N/A" if not cpuinfo else cpuinfo.get_cpu_info().get('brand_raw','N/A'))
-    info['python_version'] = sys.version.replace('\n',' ')
-    info['boot_time'] = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S") if psutil else "N/A"
-    return info
+        fqdn = "N/A"
+    cpuinfo = _lazy('cpuinfo')
+    return BasicInfo(
+        username=getpass.getuser(),
+        hostname=socket.gethostname(),
+        fqdn=fqdn,
+        platform=platform.system(),
+        platform_release=platform.release(),
+        platform_version=platform.version(),
+        architecture=platform.machine(),
+        processor=platform.processor() or ("N/A" if not cpuinfo else _cpuinfo().get('brand_raw','N/A')),
+        python_version=sys.version.replace('\n',' '),
+        boot_time=datetime.fromtimestamp(_boot_time()).strftime("%Y-%m-%d %H:%M:%S") if psutil else "N/A",
+    )
 
 def get_uptime():
     if not psutil:
         return "N/A"
-    boot = datetime.fromtimestamp(psutil.boot_time())
+    boot = datetime.fromtimestamp(_boot_time())
     delta = datetime.now() - boot
     return str(delta).split('.')[0]  
 
-def get_cpu_info():
-    out = {}
-    if cpuinfo:
+@functools.lru_cache(maxsize=1)
+def _static_cpu_info():
+    out = CpuInfo()
+    if _lazy('cpuinfo'):
         try:
-            ci = cpuinfo.get_cpu_info()
-            out['brand'] = ci.get('brand_raw','N/A')
-            out['arch'] = ci.get('arch','N/A')
-            out['bits'] = ci.get('bits','N/A')
-            out['count_logical'] = psutil.cpu_count(logical=True) if psutil else "N/A"
-            out['count_physical'] = psutil.cpu_count(logical=False) if psutil else "N/A"
+            ci = _cpuinfo()
+            out.brand = ci.get('brand_raw','N/A')
+            out.arch = ci.get('arch','N/A')
+            out.bits = ci.get('bits','N/A')
+            out.count_logical = psutil.cpu_count(logical=True) if psutil else "N/A"
+            out.count_physical = psutil.cpu_count(logical=False) if psutil else "N/A"
         except Exception:
-            out['brand'] = platform.processor()
+            out.brand = platform.processor()
     else:
-        out['brand'] = platform.processor() or "N/A"
-        out['count_logical'] = psutil.cpu_count(logical=True) if psutil else "N/A"
-        out['count_physical'] = psutil.cpu_count(logical=False) if psutil else "N/A"
+        out.brand = platform.processor() or "N/A"
+        out.count_logical = psutil.cpu_count(logical=True) if psutil else "N/A"
+        out.count_physical = psutil.cpu_count(logical=False) if psutil else "N/A"
 
     if psutil:
         try:
-            out['freq'] = psutil.cpu_freq().max if psutil.cpu_freq() else "N/A"
-            out['usage_per_core'] = psutil.cpu_percent(interval=0.5, percpu=True)
-            out['total_cpu_percent'] = psutil.cpu_percent(interval=0.1)
+            freq = psutil.cpu_freq()
+            out.freq = freq.max if freq else "N/A"
         except Exception:
-            out['usage_per_core'] = []
-            out['total_cpu_percent'] = "N/A"
+            pass
     return out
 
+def get_cpu_info():
+    static = _static_cpu_info()
+    if not psutil:
+        return replace(static)
+    try:
+        return replace(static,
+                       usage_per_core=psutil.cpu_percent(interval=None, percpu=True),
+                       total_cpu_percent=psutil.cpu_percent(interval=None))
+    except Exception:
+        return replace(static)
+
 def get_memory_info():
     if not psutil:
-        return {}
+        return None
     vm = psutil.virtual_memory()
     sm = psutil.swap_memory()
-    return {
-        "total": format_bytes(vm.total),
-        "available": format_bytes(vm.available),
-        "used": format_bytes(vm.used),
-        "percent": f"{vm.percent}%",
-        "swap_total": format_bytes(sm.total),
-        "swap_used": format_bytes(sm.used),
-        "swap_percent": f"{sm.percent}%"
-    }
+    return MemoryInfo(
+        total=format_bytes(vm.total),
+        available=format_bytes(vm.available),
+        used=format_bytes(vm.used),
+        percent=f"{vm.percent}%",
+        swap_total=format_bytes(sm.total),
+        swap_used=format_bytes(sm.used),
+        swap_percent=f"{sm.percent}%",
+    )
+
+# Only these get a disk_usage() (statvfs) call; tmpfs/overlay/squashfs
+# snap mounts and the like are skipped. fuseblk is how ntfs-3g and
+# exfat-fuse volumes report themselves. Network filesystems (nfs, cifs)
+# are left out on purpose: statvfs on a stale mount can hang.
+_REAL_FSTYPES = {'ext2','ext3','ext4','xfs','btrfs','f2fs','zfs','ntfs','ntfs3','refs','apfs','hfs',
+                 'vfat','fat','fat32','exfat','msdos','fuseblk'}
+# Specific pseudo trees only: removable media lives under /run/media/.
+_PSEUDO_MOUNT_PREFIXES = ('/snap/', '/sys/', '/proc/', '/run/snapd/', '/run/user/', '/run/credentials/')
 
 def get_disk_info():
     if not psutil:
-        return {}
+        return DiskInfo()
     parts = []
     for p in psutil.disk_partitions(all=False):
+        if p.fstype.lower() not in _REAL_FSTYPES or p.mountpoint.startswith(_PSEUDO_MOUNT_PREFIXES):
+            continue
         try:
             usage = psutil.disk_usage(p.mountpoint)
-            parts.append({
-                "device": p.device,
-                "mountpoint": p.mountpoint,
-                "fstype": p.fstype,
-                "opts": p.opts,
-                "total": format_bytes(usage.total),
-                "used": format_bytes(usage.used),
-                "free": format_bytes(usage.free),
-                "percent": f"{usage.percent}%"
-            })
+            parts.append(Partition(
+                device=p.device,
+                mountpoint=p.mountpoint,
+                fstype=p.fstype,
+                opts=p.opts,
+                total=format_bytes(usage.total),
+                used=format_bytes(usage.used),
+                free=format_bytes(usage.free),
+                percent=f"{usage.percent}%",
+            ))
         except PermissionError:
-            parts.append({
-                "device": p.device,
-                "mountpoint": p.mountpoint,
-                "fstype": p.fstype,
-                "opts": p.opts,
-                "total": "Permission denied",
-                "used": "Permission denied",
-                "free": "Permission denied",
-                "percent": "N/A"
-            })
-    disk_io = psutil.disk_io_counters() if psutil else None
-    return {"partitions": parts, "disk_io": disk_io}
+            parts.append(Partition(
+                device=p.device,
+                mountpoint=p.mountpoint,
+                fstype=p.fstype,
+                opts=p.opts,
+                total="Permission denied",
+                used="Permission denied",
+                free="Permission denied",
+                percent="N/A",
+            ))
+    return DiskInfo(partitions=parts, disk_io=psutil.disk_io_counters())
+
+@_ttl_cache(seconds=30)
+def _nic_lines():
+    # NIC configuration rarely changes mid-session, so the two interface
+    # scans are only repeated every 30s.
+    addrs = psutil.net_if_addrs()
+    stats = psutil.net_if_stats()
+    # The report only prints these, so format the lines in this pass.
+    nic_lines = []
+    append = nic_lines.append
+    for nic, addr_list in addrs.items():
+        append(f"  NIC: {nic} Up: {stats[nic].isup if nic in stats else 'N/A'}")
+        for a in addr_list:
+            append(f"    {a.family!s}: {a.address} Netmask: {a.netmask} Broadcast: {a.broadcast}")
+    return nic_lines
 
 def get_network_info():
-    net = {}
+    net = NetworkInfo()
     try:
-        hostname = socket.gethostname()
-        net['hostname'] = hostname
-        net['local_ip'] = socket.gethostbyname(hostname)
+        net.hostname = socket.gethostname()
+        # connect() on a UDP socket only picks the outbound interface from
+        # the routing table: no packet is sent and no DNS lookup happens.
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('10.255.255.255', 1))
+            net.local_ip = s.getsockname()[0]
     except Exception:
-        net['local_ip'] = "N/A"
+        net.local_ip = "N/A"
 
     if psutil:
-        addrs = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
-        nic_info = {}
-        for nic, addr_list in addrs.items():
-            nic_info[nic] = {"addresses": [], "isup": stats.get(nic).isup if nic in stats else "N/A"}
-            for a in addr_list:
-                nic_info[nic]["addresses"].append({
-                    "family": str(a.family),
-                    "address": a.address,
-                    "netmask": a.netmask,
-                    "broadcast": a.broadcast
-                })
-        net['nics'] = nic_info
+        net.nic_lines = _nic_lines()
         try:
             net_io = psutil.net_io_counters(pernic=False)
-            net['bytes_sent'] = format_bytes(net_io.bytes_sent)
-            net['bytes_recv'] = format_bytes(net_io.bytes_recv)
+            net.bytes_sent = format_bytes(net_io.bytes_sent)
+            net.bytes_recv = format_bytes(net_io.bytes_recv)
         except Exception:
             pass
     return net
 
+# GPUtil spawns nvidia-smi on every call; reuse the result across quick refreshes.
+@_ttl_cache(seconds=2)
 def get_gpu_info():
     info = []
+    GPUtil = _lazy('GPUtil')
     if GPUtil:
         try:
             gpus = GPUtil.getGPUs()
             for g in gpus:
-                info.append({
-                    "id": g.id,
-                    "name": g.name,
-                    "load": f"{g.load*100:.1f}%",
-                    "memory_total": f"{g.memoryTotal}MB",
-                    "memory_used": f"{g.memoryUsed}MB",
-                    "temperature": f"{g.temperature} °C"
-                })
+                info.append(GpuInfo(
+                    id=g.id,
+                    name=g.name,
+                    load=f"{g.load*100:.1f}%",
+                    memory_total=f"{g.memoryTotal}MB",
+                    memory_used=f"{g.memoryUsed}MB",
+                    temperature=f"{g.temperature} °C",
+                ))
         except Exception:
             pass
     return info
 
+def _iter_process_info():
+    for p in psutil.process_iter():
+        try:
+            with p.oneshot():
+                # Fields we may not read (other users' processes on macOS)
+                # become None; the process itself stays in the list.
+                info = ProcessInfo(**p.as_dict(['pid', 'name', 'username', 'cpu_percent', 'memory_percent'],
+                                               ad_value=None))
+        except psutil.NoSuchProcess:
+            continue
+        yield info
+
+_LINUX_PROC = sys.platform.startswith('linux') and os.path.isdir('/proc')
+if _LINUX_PROC:
+    _CLK_TCK = os.sysconf('SC_CLK_TCK')
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# (pid, starttime) -> utime+stime ticks seen by the previous /proc scan.
+_proc_prev_ticks = {}
+_proc_prev_scan = None
+
+@functools.lru_cache(maxsize=None)
+def _uid_name(uid):
+    import pwd
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+@functools.lru_cache(maxsize=1)
+def _total_memory():
+    return psutil.virtual_memory().total
+
+def _iter_proc_stat():
+    """Read /proc/<pid>/stat directly, skipping psutil's per-process overhead.
+
+    CPU% is the share of one CPU used since the previous scan, like
+    psutil's Process.cpu_percent(); it is 0.0 on the first scan.
+    """
+    global _proc_prev_ticks, _proc_prev_scan
+    now = time.monotonic()
+    elapsed = (now - _proc_prev_scan) * _CLK_TCK if _proc_prev_scan else 0
+    mem_scale = _PAGE_SIZE * 100.0 / _total_memory()
+    ticks_seen = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+            uid = os.stat(f'/proc/{entry}').st_uid
+        except OSError:
+            continue
+        # comm may contain spaces and parentheses, so split on the last ')'.
+        head, _, tail = stat.rpartition(b')')
+        stat_fields = tail.split()
+        ticks = int(stat_fields[11]) + int(stat_fields[12])
+        key = (int(entry), stat_fields[19])
+        ticks_seen[key] = ticks
+        prev = _proc_prev_ticks.get(key)
+        yield ProcessInfo(
+            pid=key[0],
+            name=head.partition(b'(')[2].decode(errors='replace'),
+            username=_uid_name(uid),
+            cpu_percent=round((ticks - prev) * 100.0 / elapsed, 1) if prev is not None and elapsed else 0.0,
+            memory_percent=int(stat_fields[21]) * mem_scale,
+        )
+    _proc_prev_ticks, _proc_prev_scan = ticks_seen, now
+
 def get_top_processes(limit=8):
-    result = []
     if not psutil:
-        return result
+        return []
+    procs = _iter_proc_stat() if _LINUX_PROC else _iter_process_info()
     try:
-        procs = []
-        for p in psutil.process_iter(['pid','name','username','cpu_percent','memory_percent']):
-            procs.append(p.info)
-        procs_sorted = sorted(procs, key=lambda p: (p.get('cpu_percent',0) or 0), reverse=True)
-        for p in procs_sorted[:limit]:
-            result.append(p)
+        # Only the top `limit` are shown, so avoid sorting every process.
+        return heapq.nlargest(limit, procs, key=lambda p: p.cpu_percent or 0)
     except Exception:
-        pass
-    return result
+        return []
+
+# One pool for the life of the app, one thread per collector below, so the
+# periodic refresh does not spawn a fresh set of threads each time.
+_POOL = ThreadPoolExecutor(max_workers=7)
 
 def gather_all_info():
-    """Collect everything in a dict."""
-    data = {}
-    data['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    data['basic'] = get_basic_info()
-    data['uptime'] = get_uptime()
-    data['cpu'] = get_cpu_info()
-    data['memory'] = get_memory_info()
-    data['disk'] = get_disk_info()
-    data['network'] = get_network_info()
-    data['gpu'] = get_gpu_info()
-    data['top_processes'] = get_top_processes()
-    return data
-
-def pretty_print(info_dict):
+    """Collect everything into a SystemInfo record."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    collectors = {
+        'uptime': get_uptime,
+        'cpu': get_cpu_info,
+        'memory': get_memory_info,
+        'disk': get_disk_info,
+        'network': get_network_info,
+        'gpu': get_gpu_info,
+        'top_processes': get_top_processes,
+    }
+    # psutil releases the GIL during its syscalls, so the collectors overlap.
+    futures = {key: _POOL.submit(fn) for key, fn in collectors.items()}
+    basic = get_basic_info()
+    return SystemInfo(timestamp=timestamp, basic=basic,
+                      **{key: fut.result() for key, fut in futures.items()})
+
+class _Default(dict):
+    """format_map context that renders unknown placeholders as 'N/A'."""
+    def __missing__(self, key):
+        return "N/A"
+
+_RULE = "="*80
+
+# One template per report section; iter_report fills them with format_map.
+_REPORT_SECTIONS = (
+    """SYSTEM REPORT - Generated: {timestamp}
+{rule}
+Basic Info:
+  User: {basic.username}
+  Hostname: {basic.hostname} (FQDN: {basic.fqdn})
+  Platform: {basic.platform} {basic.platform_release} {basic.platform_version}
+  Architecture: {basic.architecture}
+  Processor: {basic.processor}
+  Python: {basic.python_version}
+  Boot Time: {basic.boot_time} (Uptime: {uptime})
+
+""",
+    """CPU:
+  Brand: {cpu.brand}
+  Logical cores: {cpu.count_logical}, Physical cores: {cpu.count_physical}
+  Frequency (max MHz): {cpu.freq}
+  Total CPU%: {cpu.total_cpu_percent}{per_core_line}
+
+""",
+    """Memory:{mem_block}
+
+""",
+    """Disk Partitions:{disk_block}
+
+""",
+    """Network:
+  Local IP: {network.local_ip} Hostname: {network.hostname}{nic_block}
+  Bytes Sent: {network.bytes_sent} Bytes Recv: {network.bytes_recv}
+
+""",
+    """GPU(s):
+{gpu_block}
+
+""",
+    """Top Processes (by CPU):{proc_block}
+{rule}""",
+)
+
+def iter_report(info):
+    """Yield the formatted report one section at a time."""
+    per_core = info.cpu.usage_per_core
+    mem = info.memory
+    ctx = _Default(
+        rule=_RULE,
+        timestamp=info.timestamp,
+        uptime=info.uptime,
+        basic=info.basic,
+        cpu=info.cpu,
+        network=info.network,
+        # Repeated rows are pre-rendered and spliced into the templates.
+        per_core_line=f"\n  Per-core usage: {', '.join(f'{u}%' for u in per_core)}" if per_core else "",
+        mem_block="".join(f"\n  {label}: {getattr(mem, name)}" for name, label in _MEMORY_LABELS) if mem else "",
+        disk_block="".join(
+            f"\n  Device: {p.device} Mount: {p.mountpoint} Type: {p.fstype}"
+            f"\n    Total: {p.total} Used: {p.used} Free: {p.free} Usage: {p.percent}"
+            for p in info.disk.partitions
+        ),
+        nic_block="".join("\n" + line for line in info.network.nic_lines),
+        gpu_block="\n".join(
+            f"  {g.name} (id={g.id}) Load: {g.load} Mem: {g.memory_used}/{g.memory_total} Temp: {g.temperature}"
+            for g in info.gpu
+        ) or "  No GPU info or GPUtil not installed.",
+        proc_block="".join(
+            f"\n  PID {p.pid} {p.name} user={p.username} CPU%={p.cpu_percent} MEM%={p.memory_percent}"
+            for p in info.top_processes
+        ),
+    )
+    for template in _REPORT_SECTIONS:
+        yield template.format_map(ctx)
+
+def pretty_print(info):
     """Turn gathered info into a nicely formatted string report."""
-    lines = []
-    append = lines.append
-    append(f"SYSTEM REPORT - Generated: {info_dict.get('timestamp','N/A')}")
-    append("="*80)
-    b = info_dict.get('basic',{})
-    append("Basic Info:")
-    append(f"  User: {b.get('username','N/A')}")
-    append(f"  Hostname: {b.get('hostname','N/A')} (FQDN: {b.get('fqdn','N/A')})")
-    append(f"  Platform: {b.get('platform','N/A')} {b.get('platform_release','')} {b.get('platform_version','')}")
-    append(f"  Architecture: {b.get('architecture','N/A')}")
-    append(f"  Processor: {b.get('processor','N/A')}")
-    append(f"  Python: {b.get('python_version','N/A')}")
-    append(f"  Boot Time: {b.get('boot_time','N/A')} (Uptime: {info_dict.get('uptime','N/A')})")
-    append("")
-
-    append("CPU:")
-    cpu = info_dict.get('cpu',{})
-    append(f"  Brand: {cpu.get('brand','N/A')}")
-    append(f"  Logical cores: {cpu.get('count_logical','N/A')}, Physical cores: {cpu.get('count_physical','N/A')}")
-    append(f"  Frequency (max MHz): {cpu.get('freq','N/A')}")
-    append(f"  Total CPU%: {cpu.get('total_cpu_percent','N/A')}")
-    if cpu.get('usage_per_core'):
-        append(f"  Per-core usage: {', '.join(f'{u}%' for u in cpu['usage_per_core'])}")
-    append("")
-
-    append("Memory:")
-    mem = info_dict.get('memory',{})
-    for k,v in mem.items():
-        append(f"  {k.replace('_',' ').title()}: {v}")
-    append("")
-
-    append("Disk Partitions:")
-    for p in info_dict.get('disk',{}).get('partitions',[]):
-        append(f"  Device: {p['device']} Mount: {p['mountpoint']} Type: {p['fstype']}")
-        append(f"    Total: {p['total']} Used: {p['used']} Free: {p['free']} Usage: {p['percent']}")
-    append("")
-
-    append("Network:")
-    net = info_dict.get('network',{})
-    append(f"  Local IP: {net.get('local_ip','N/A')} Hostname: {net.get('hostname','N/A')}")
-    nics = net.get('nics',{})
-    for nic, nd in nics.items():
-        append(f"  NIC: {nic} Up: {nd.get('isup')}")
-        for a in nd.get('addresses',[]):
-            append(f"    {a.get('family')}: {a.get('address')} Netmask: {a.get('netmask')} Broadcast: {a.get('broadcast')}")
-    append(f"  Bytes Sent: {net.get('bytes_sent','N/A')} Bytes Recv: {net.get('bytes_recv','N/A')}")
-    append("")
-
-    append("GPU(s):")
-    gpus = info_dict.get('gpu',[])
-    if not gpus:
-        append("  No GPU info or GPUtil not installed.")
-    else:
-        for g in gpus:
-            append(f"  {g['name']} (id={g['id']}) Load: {g['load']} Mem: {g['memory_used']}/{g['memory_total']} Temp: {g['temperature']}")
-    append("")
+    buf = io.StringIO()
+    buf.writelines(iter_report(info))
+    return buf.getvalue()
 
-    append("Top Processes (by CPU):")
-    for p in info_dict.get('top_processes',[]):
-        append(f"  PID {p.get('pid')} {p.get('name')} user={p.get('username')} CPU%={p.get('cpu_percent')} MEM%={p.get('memory_percent')}")
-    append("="*80)
-    return "\n".join(lines)
+AUTO_REFRESH_MS = 5000
 
 class SystemInfoGUI:
     def __init__(self, root):
         self.root = root
         self.data_text_widget = None
         self.status_var = None
+        self.latest_info = None
+        self._refreshing = threading.Event()
+        # A single long-lived worker runs the collections queued by the UI.
+        self._work_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         self._setup_ui()
-        self.refresh_info_async()
+        self._auto_refresh()
 
     def _setup_ui(self):
         if UI_FRAMEWORK == "custom":
@@ -339,25 +617,44 @@ class SystemInfoGUI:
             self.data_text_widget.configure(state='disabled')
 
     def refresh_info_async(self):
-        t = threading.Thread(target=self._refresh_info)
-        t.daemon = True
-        t.start()
+        # Drop the request if a collection is still running, so rapid
+        # clicks don't stack up concurrent gather_all_info() calls.
+        if self._refreshing.is_set():
+            return
+        self._refreshing.set()
+        self._work_q.put(self._refresh_info)
+
+    def _auto_refresh(self):
+        self.refresh_info_async()
+        self.root.after(AUTO_REFRESH_MS, self._auto_refresh)
+
+    def _worker_loop(self):
+        while True:
+            task = self._work_q.get()
+            try:
+                task()
+            except Exception:
+                # A failed refresh/export must not take the only worker down
+                # with it, or every later button press would queue forever.
+                pass
 
     def _refresh_info(self):
+        # Runs on a worker thread: widget updates are posted to the Tk loop.
+        after = self.root.after
         try:
-            self._set_status("Collecting system information...")
+            after(0, self._set_status, "Collecting system information...")
             info = gather_all_info()
-            text = pretty_print(info)
-            self._set_text(text)
-            self._set_status(f"Last updated: {info.get('timestamp')}")
-            self.latest_report = text
+            after(0, self._set_text, pretty_print(info))
+            after(0, self._set_status, f"Last updated: {info.timestamp}")
+            self.latest_info = info
         except Exception as e:
-            self._set_status(f"Error: {e}")
+            after(0, self._set_status, f"Error: {e}")
+        finally:
+            self._refreshing.clear()
 
     def _set_text(self, txt):
         self.data_text_widget.configure(state='normal')
-        self.data_text_widget.delete('1.0', 'end')
-        self.data_text_widget.insert('1.0', txt)
+        self.data_text_widget.replace('1.0', 'end', txt)
         self.data_text_widget.configure(state='disabled')
 
     def _set_status(self, s):
@@ -376,11 +673,10 @@ class SystemInfoGUI:
                                                 filetypes=[("Text files","*.txt"),("All files","*.*")])
             if not file:
                 return
-            if not hasattr(self, 'latest_report') or not self.latest_report:
-                info = gather_all_info()
-                self.latest_report = pretty_print(info)
+            if not self.latest_info:
+                self.latest_info = gather_all_info()
             with open(file, 'w', encoding='utf-8') as f:
-                f.write(self.latest_report)
+                f.writelines(iter_report(self.latest_info))
             messagebox.showinfo("Exported", f"Report saved to: {file}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {e}")
@@ -14,6 +14,8 @@ Run: pip install psutil py-cpuinfo gputil customtkinter matplotlib
 Author: Mayur
 """
 
+import functools
+import heapq
 import threading
 import time
 import os
@@ -21,6 +23,8 @@ import platform
 import sys
 import socket
 import getpass
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 try:
@@ -28,15 +32,26 @@ try:
 except Exception:
     psutil = None
 
+# Prime the per-core counters so later interval=None samples measure the
+# time since the previous refresh instead of sleeping.
+if psutil:
+    try:
+        psutil.cpu_percent(interval=None, percpu=True)
+    except Exception:
+        pass
+
+# Boot time is fixed for the life of the process; read it once.
 try:
-    import cpuinfo
+    _BOOT_TS = psutil.boot_time() if psutil else None
 except Exception:
-    cpuinfo = None
+    _BOOT_TS = None
 
+# Likewise the nominal max frequency; cpu_freq() scans sysfs per core.
 try:
-    import GPUtil
+    _freq = psutil.cpu_freq() if psutil else None
+    _CPU_FREQ_MAX = _freq.max if _freq else 'N/A'
 except Exception:
-    GPUtil = None
+    _CPU_FREQ_MAX = 'N/A'
 
 USE_CUSTOM = True
 try:
@@ -47,6 +62,20 @@ except Exception:
     import tkinter as ctk  
     from tkinter import scrolledtext, filedialog, messagebox
 
+# Widget classes resolved once for whichever toolkit was imported above.
+if USE_CUSTOM:
+    _Frame, _Label, _Button = ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton
+else:
+    _Frame, _Label, _Button = ctk.Frame, ctk.Label, ctk.Button
+
+
+def _colors(parent, fg=None):
+    # Plain Tk needs the dark palette passed explicitly; CustomTkinter themes itself.
+    if USE_CUSTOM:
+        return {}
+    return {'bg': parent['bg'], 'fg': fg} if fg else {'bg': parent['bg']}
+
+
 try:
     import matplotlib
     matplotlib.use('Agg')  
@@ -56,19 +85,22 @@ try:
 except Exception:
     HAS_MPL = False
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(n):
     try:
         n = float(n)
+        # bit_length of the integer part picks the 1024-power in one step.
+        i = min(max(int(abs(n)).bit_length() - 1, 0) // 10, len(_UNITS) - 1)
     except Exception:
         return str(n)
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if abs(n) < 1024.0:
-            return f"{n:3.2f} {unit}"
-        n /= 1024.0
-    return f"{n:.2f} PB"
+    return f"{n / (1 << (i * 10)):3.2f} {_UNITS[i]}"
 
 
+@functools.lru_cache(maxsize=1)
 def get_basic_info():
+    # Nothing here changes between refreshes, and cpuinfo is slow to probe.
     b = {}
     b['user'] = getpass.getuser()
     b['hostname'] = socket.gethostname()
@@ -78,21 +110,24 @@ def get_basic_info():
     b['arch'] = platform.machine()
     b['python'] = sys.version.replace('\n',' ')
     try:
-        b['processor'] = (cpuinfo.get_cpu_info().get('brand_raw') if cpuinfo else platform.processor()) or 'N/A'
+        # Imported here, not at module load: py-cpuinfo is slow to import and
+        # this cached function is its only user.
+        import cpuinfo
+        b['processor'] = cpuinfo.get_cpu_info().get('brand_raw') or platform.processor() or 'N/A'
     except Exception:
         b['processor'] = platform.processor() or 'N/A'
     try:
-        b['boot_time'] = datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S') if psutil else 'N/A'
+        b['boot_time'] = datetime.fromtimestamp(_BOOT_TS).strftime('%Y-%m-%d %H:%M:%S') if _BOOT_TS else 'N/A'
     except Exception:
         b['boot_time'] = 'N/A'
     return b
 
 
 def get_uptime():
-    if not psutil:
+    if not _BOOT_TS:
         return 'N/A'
     try:
-        boot = datetime.fromtimestamp(psutil.boot_time())
+        boot = datetime.fromtimestamp(_BOOT_TS)
         return str(datetime.now() - boot).split('.')[0]
     except Exception:
         return 'N/A'
@@ -103,9 +138,11 @@ def get_cpu():
     try:
         out['logical'] = psutil.cpu_count(logical=True) if psutil else 'N/A'
         out['physical'] = psutil.cpu_count(logical=False) if psutil else 'N/A'
-        out['freq'] = psutil.cpu_freq().max if psutil and psutil.cpu_freq() else 'N/A'
-        out['total_percent'] = psutil.cpu_percent(interval=0.1) if psutil else 'N/A'
-        out['per_core'] = psutil.cpu_percent(interval=0.1, percpu=True) if psutil else []
+        out['freq'] = _CPU_FREQ_MAX
+        # One non-blocking per-core snapshot; the total is its average.
+        per_core = psutil.cpu_percent(interval=None, percpu=True) if psutil else []
+        out['total_percent'] = round(sum(per_core) / len(per_core), 1) if per_core else 'N/A'
+        out['per_core'] = per_core
     except Exception:
         out['per_core'] = []
     return out
@@ -127,35 +164,73 @@ def get_memory():
     }
 
 
+# Fill levels change slowly, while disk_usage() on a network mount can block
+# for hundreds of ms, so each mount's usage is reused for _DISK_TTL seconds.
+_DISK_TTL = 60
+_disk_cache = {}
+# Separate from _POOL: get_disks itself runs there and waits on these.
+_DISK_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _disk_usage(mount):
+    now = time.monotonic()
+    entry = _disk_cache.get(mount)
+    if entry and now < entry[0]:
+        return entry[1]
+    u = psutil.disk_usage(mount)
+    _disk_cache[mount] = (now + _DISK_TTL, u)
+    return u
+
+
 def get_disks():
     if not psutil:
         return []
+    # The mount table is cheap to read, so it is listed afresh each time: new drives
+    # show up and unmounted ones drop out on the next refresh.
+    partitions = psutil.disk_partitions(all=False)
+    for mount in _disk_cache.keys() - {p.mountpoint for p in partitions}:
+        _disk_cache.pop(mount, None)
+    usages = [_DISK_POOL.submit(_disk_usage, p.mountpoint) for p in partitions]
     parts = []
-    for p in psutil.disk_partitions(all=False):
+    for p, fut in zip(partitions, usages):
         try:
-            u = psutil.disk_usage(p.mountpoint)
+            u = fut.result()
             parts.append({'device': p.device, 'mount': p.mountpoint, 'fstype': p.fstype,
                           'total': format_bytes(u.total), 'used': format_bytes(u.used), 'free': format_bytes(u.free), 'percent': f"{u.percent}%"})
         except PermissionError:
             parts.append({'device': p.device, 'mount': p.mountpoint, 'fstype': p.fstype, 'total': 'Denied'})
+        except OSError:
+            # Unmounted between listing and statvfs; leave it out.
+            continue
     return parts
 
 
-def get_network():
-    net = {}
+def _route_ip():
+    # connect() on a UDP socket only asks the routing table for the source
+    # address: no packet is sent and no name lookup happens.
     try:
-        net['local_ip'] = socket.gethostbyname(socket.gethostname())
-    except Exception:
-        net['local_ip'] = 'N/A'
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('8.8.8.8', 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
+
+
+def get_network():
+    net = {'local_ip': _route_ip() or 'N/A'}
     if psutil:
         try:
             ni = psutil.net_if_addrs()
+            if net['local_ip'] == 'N/A':
+                # No default route: take the first non-loopback IPv4 address.
+                net['local_ip'] = next((a.address for addrs in ni.values() for a in addrs
+                                        if a.family == socket.AF_INET and not a.address.startswith('127.')), 'N/A')
             stats = psutil.net_if_stats()
-            net['nics'] = {}
-            for name, addrs in ni.items():
-                net['nics'][name] = {'isup': stats[name].isup if name in stats else 'N/A', 'addrs': []}
-                for a in addrs:
-                    net['nics'][name]['addrs'].append({'addr': a.address, 'netmask': a.netmask})
+            net['nics'] = {
+                name: {'isup': s.isup if (s := stats.get(name)) else 'N/A',
+                       'addrs': [{'addr': a.address, 'netmask': a.netmask} for a in addrs]}
+                for name, addrs in ni.items()
+            }
             io = psutil.net_io_counters()
             net['bytes_sent'] = format_bytes(io.bytes_sent)
             net['bytes_recv'] = format_bytes(io.bytes_recv)
@@ -164,8 +239,19 @@ def get_network():
     return net
 
 
+@functools.lru_cache(maxsize=1)
+def _gputil():
+    # Deferred import of the optional GPUtil; a failed import is not retried.
+    try:
+        import GPUtil
+    except Exception:
+        return None
+    return GPUtil
+
+
 def get_gpu():
     out = []
+    GPUtil = _gputil()
     if GPUtil:
         try:
             for g in GPUtil.getGPUs():
@@ -176,132 +262,150 @@ def get_gpu():
 
 
 def get_top_processes(limit=8):
-    res = []
     if not psutil:
-        return res
+        return []
     try:
         procs = []
-        for p in psutil.process_iter(['pid','name','username','cpu_percent','memory_percent']):
-            procs.append(p.info)
-        for p in sorted(procs, key=lambda x: x.get('cpu_percent') or 0, reverse=True)[:limit]:
-            res.append(p)
+        # process_iter() keeps its Process objects between calls, so
+        # cpu_percent reports usage since the previous refresh.
+        for p in psutil.process_iter():
+            try:
+                with p.oneshot():
+                    # username() is skipped: it costs a uid lookup and the report never shows it.
+                    # Denied fields (other users' processes on macOS) read as None.
+                    info = p.as_dict(['name', 'cpu_percent', 'memory_percent'], ad_value=None)
+                info['pid'] = p.pid
+                procs.append(info)
+            except psutil.NoSuchProcess:
+                continue
+        return heapq.nlargest(limit, procs, key=lambda x: x['cpu_percent'] or 0)
     except Exception:
-        pass
-    return res
+        return []
+
+
+# Shared by the collectors below; they block in syscalls or subprocesses
+# with the GIL released, so running them side by side cuts refresh time.
+_POOL = ThreadPoolExecutor(max_workers=6)
 
 
 def gather_all():
-    return {
+    futures = {
+        'cpu': _POOL.submit(get_cpu),
+        'memory': _POOL.submit(get_memory),
+        'disks': _POOL.submit(get_disks),
+        'network': _POOL.submit(get_network),
+        'gpu': _POOL.submit(get_gpu),
+        'top': _POOL.submit(get_top_processes),
+    }
+    data = {
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'basic': get_basic_info(),
         'uptime': get_uptime(),
-        'cpu': get_cpu(),
-        'memory': get_memory(),
-        'disks': get_disks(),
-        'network': get_network(),
-        'gpu': get_gpu(),
-        'top': get_top_processes()
     }
+    for key, fut in futures.items():
+        data[key] = fut.result()
+    return data
 
 
 def pretty_report(data):
-    lines = []
-    lines.append(f"SYSTEM REPORT - {data.get('timestamp')}")
-    lines.append('-'*60)
     b = data.get('basic', {})
-    lines.append(f"User: {b.get('user')}@{b.get('hostname')}")
-    lines.append(f"Platform: {b.get('platform')} {b.get('release')} {b.get('arch')}")
-    lines.append(f"Processor: {b.get('processor')}")
-    lines.append(f"Python: {b.get('python')}")
-    lines.append(f"Boot: {b.get('boot_time')} Uptime: {data.get('uptime')}")
-    lines.append('\nCPU:')
     c = data.get('cpu', {})
-    lines.append(f"  Cores: {c.get('logical')}(logical)/{c.get('physical')}(physical)  Total%: {c.get('total_percent')}")
-    lines.append('\nMemory:')
-    m = data.get('memory', {})
-    for k, v in m.items():
-        lines.append(f"  {k}: {v}")
-    lines.append('\nDisks:')
-    for d in data.get('disks', []):
-        lines.append(f"  {d.get('device')} mounted on {d.get('mount')} {d.get('total')} ({d.get('percent','')})")
-    lines.append('\nTop processes:')
-    for p in data.get('top', []):
-        lines.append(f"  PID {p.get('pid')} {p.get('name')} CPU%={p.get('cpu_percent')} MEM%={p.get('memory_percent')}")
-    return '\n'.join(lines)
+    header = f"""SYSTEM REPORT - {data.get('timestamp')}
+{'-'*60}
+User: {b.get('user')}@{b.get('hostname')}
+Platform: {b.get('platform')} {b.get('release')} {b.get('arch')}
+Processor: {b.get('processor')}
+Python: {b.get('python')}
+Boot: {b.get('boot_time')} Uptime: {data.get('uptime')}
+
+CPU:
+  Cores: {c.get('logical')}(logical)/{c.get('physical')}(physical)  Total%: {c.get('total_percent')}
+"""
+    parts = [
+        header,
+        'Memory:',
+        *(f"  {k}: {v}" for k, v in data.get('memory', {}).items()),
+        '\nDisks:',
+        *(f"  {d.get('device')} mounted on {d.get('mount')} {d.get('total')} ({d.get('percent','')})"
+          for d in data.get('disks', [])),
+        '\nTop processes:',
+        *(f"  PID {p.get('pid')} {p.get('name')} CPU%={p.get('cpu_percent')} MEM%={p.get('memory_percent')}"
+          for p in data.get('top', [])),
+    ]
+    return '\n'.join(parts)
+
+
+REFRESH_INTERVAL_MS = 8000
+
+# Sidebar/card label templates, filled with format_map; missing keys show '-'.
+LABEL_USER_TMPL = "User: {user}"
+LABEL_HOST_TMPL = "Host: {hostname}"
+CARD_CPU_TMPL = "{total_percent}% ({logical}c)"
+CARD_MEM_TMPL = "{percent} — {used}/{total}"
+CARD_DISK_TMPL = "{device} {used}/{total}"
+CARD_NET_TMPL = "IP: {local_ip}"
+
+
+def _fill(template, values):
+    return template.format_map(defaultdict(lambda: '-', values))
 
 
 class DashboardApp:
     def __init__(self, root):
         self.root = root
         self.root.title('FullInfo - Mayur Dhole')
-        self.latest_text = ''
-        self.cpu_history = []
-        self.mem_history = []
+        self._latest_snapshot = None
+        self._last_rendered_text = ''
+        self._report_sections = []
+        self.cpu_history = deque(maxlen=30)
+        self.mem_history = deque(maxlen=30)
         self._build_ui()
         self.refresh_async()
+        self._schedule()
 
     def _build_ui(self):
-        if USE_CUSTOM and ctk.__name__ == 'customtkinter':
+        if USE_CUSTOM:
             ctk.set_appearance_mode('dark')
             ctk.set_default_color_theme('dark-blue')
 
         self.root.geometry('1100x700')
-        if USE_CUSTOM and ctk.__name__ == 'customtkinter':
-            container = ctk.CTkFrame(self.root)
-            container.pack(fill='both', expand=True)
-            sidebar = ctk.CTkFrame(container, width=220)
-            sidebar.pack(side='left', fill='y', padx=8, pady=8)
-            main = ctk.CTkFrame(container)
-            main.pack(side='left', fill='both', expand=True, padx=8, pady=8)
-        else:
-            container = ctk.Frame(self.root)
-            container.pack(fill='both', expand=True)
-            sidebar = ctk.Frame(container, width=220, bg='#2b2b2b')
-            sidebar.pack(side='left', fill='y', padx=8, pady=8)
-            main = ctk.Frame(container, bg='#1e1e1e')
-            main.pack(side='left', fill='both', expand=True, padx=8, pady=8)
-
-        if USE_CUSTOM and ctk.__name__ == 'customtkinter':
-            title = ctk.CTkLabel(sidebar, text='FullInfo', font=('Helvetica', 18, 'bold'))
-            title.pack(pady=(6,12))
-            self.lbl_user = ctk.CTkLabel(sidebar, text='User: -')
-            self.lbl_user.pack(anchor='w', padx=12)
-            self.lbl_host = ctk.CTkLabel(sidebar, text='Host: -')
-            self.lbl_host.pack(anchor='w', padx=12)
-            sep = ctk.CTkLabel(sidebar, text='')
+        container = _Frame(self.root)
+        container.pack(fill='both', expand=True)
+        sidebar = _Frame(container, width=220, **({} if USE_CUSTOM else {'bg': '#2b2b2b'}))
+        sidebar.pack(side='left', fill='y', padx=8, pady=8)
+        main = _Frame(container, **({} if USE_CUSTOM else {'bg': '#1e1e1e'}))
+        main.pack(side='left', fill='both', expand=True, padx=8, pady=8)
+
+        pad = 12 if USE_CUSTOM else 8
+        title = _Label(sidebar, text='FullInfo', font=('Helvetica', 18, 'bold') if USE_CUSTOM else ('Helvetica', 16),
+                       **_colors(sidebar, 'white'))
+        title.pack(pady=(6,12))
+        self.lbl_user = _Label(sidebar, text='User: -', **_colors(sidebar, 'white'))
+        self.lbl_user.pack(anchor='w', padx=pad)
+        self.lbl_host = _Label(sidebar, text='Host: -', **_colors(sidebar, 'white'))
+        self.lbl_host.pack(anchor='w', padx=pad)
+        if USE_CUSTOM:
+            sep = _Label(sidebar, text='')
             sep.pack(pady=6)
-            btn_refresh = ctk.CTkButton(sidebar, text='Refresh', command=self.refresh_async)
-            btn_refresh.pack(fill='x', padx=12, pady=6)
-            btn_export = ctk.CTkButton(sidebar, text='Export Report', command=self.export_report)
-            btn_export.pack(fill='x', padx=12)
-        else:
-            title = ctk.Label(sidebar, text='FullInfo', font=('Helvetica', 16), bg=sidebar['bg'], fg='white')
-            title.pack(pady=(6,12))
-            self.lbl_user = ctk.Label(sidebar, text='User: -', bg=sidebar['bg'], fg='white')
-            self.lbl_user.pack(anchor='w', padx=8)
-            self.lbl_host = ctk.Label(sidebar, text='Host: -', bg=sidebar['bg'], fg='white')
-            self.lbl_host.pack(anchor='w', padx=8)
-            btn_refresh = ctk.Button(sidebar, text='Refresh', command=self.refresh_async)
-            btn_refresh.pack(fill='x', padx=8, pady=8)
-            btn_export = ctk.Button(sidebar, text='Export Report', command=self.export_report)
-            btn_export.pack(fill='x', padx=8)
-
-        cards_frame = ctk.Frame(main) if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkFrame(main)
+        btn_refresh = _Button(sidebar, text='Refresh', command=self.refresh_async)
+        btn_refresh.pack(fill='x', padx=pad, pady=6 if USE_CUSTOM else 8)
+        btn_export = _Button(sidebar, text='Export Report', command=self.export_report)
+        btn_export.pack(fill='x', padx=pad)
+
+        cards_frame = _Frame(main)
         cards_frame.pack(fill='x')
 
         def make_card(parent, title):
-            if USE_CUSTOM and ctk.__name__ == 'customtkinter':
-                f = ctk.CTkFrame(parent, corner_radius=8)
-                lbl_title = ctk.CTkLabel(f, text=title, font=('Helvetica', 12, 'bold'))
-                lbl_title.pack(anchor='w', padx=8, pady=(6,0))
-                lbl_val = ctk.CTkLabel(f, text='-', font=('Consolas', 12))
-                lbl_val.pack(anchor='w', padx=8, pady=(2,8))
+            if USE_CUSTOM:
+                f = _Frame(parent, corner_radius=8)
+                size, pad = 12, 8
             else:
-                f = ctk.Frame(parent, bg=parent['bg'], bd=1, relief='flat')
-                lbl_title = ctk.Label(f, text=title, font=('Helvetica', 11, 'bold'), bg=parent['bg'], fg='white')
-                lbl_title.pack(anchor='w', padx=6, pady=(6,0))
-                lbl_val = ctk.Label(f, text='-', font=('Consolas', 11), bg=parent['bg'], fg='white')
-                lbl_val.pack(anchor='w', padx=6, pady=(2,6))
+                f = _Frame(parent, bg=parent['bg'], bd=1, relief='flat')
+                size, pad = 11, 6
+            lbl_title = _Label(f, text=title, font=('Helvetica', size, 'bold'), **_colors(parent, 'white'))
+            lbl_title.pack(anchor='w', padx=pad, pady=(6,0))
+            lbl_val = _Label(f, text='-', font=('Consolas', size), **_colors(parent, 'white'))
+            lbl_val.pack(anchor='w', padx=pad, pady=(2,pad))
             return f, lbl_val
 
         self.card_cpu, self.card_cpu_val = make_card(cards_frame, 'CPU')
@@ -312,12 +416,12 @@ class DashboardApp:
         for w in [self.card_cpu, self.card_mem, self.card_disk, self.card_net]:
             w.pack(side='left', expand=True, fill='both', padx=6, pady=6)
 
-        lower = ctk.Frame(main) if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkFrame(main)
+        lower = _Frame(main)
         lower.pack(fill='both', expand=True, pady=(8,0))
 
-        left_pane = ctk.Frame(lower, bg=lower['bg']) if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkFrame(lower)
+        left_pane = _Frame(lower, **_colors(lower))
         left_pane.pack(side='left', fill='both', expand=True, padx=6)
-        right_pane = ctk.Frame(lower, bg=lower['bg']) if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkFrame(lower)
+        right_pane = _Frame(lower, **_colors(lower))
         right_pane.pack(side='left', fill='both', expand=True, padx=6)
 
         if HAS_MPL:
@@ -331,67 +435,101 @@ class DashboardApp:
             self.ax_mem.set_title('Memory (%) — last samples')
             self.ax_mem.set_ylim(0, 100)
 
+            # The lines are animated: full draws leave them out so the cached
+            # background stays clean, and refreshes blit just the line on top.
+            self.cpu_line, = self.ax_cpu.plot([], [], animated=True)
+            self.mem_line, = self.ax_mem.plot([], [], animated=True)
+            self.ax_cpu.set_xlim(0, 29)
+            self.ax_mem.set_xlim(0, 29)
+
             self.canvas_cpu = FigureCanvasTkAgg(self.fig_cpu, master=left_pane)
             self.canvas_cpu.get_tk_widget().pack(fill='both', expand=True, padx=6, pady=6)
             self.canvas_mem = FigureCanvasTkAgg(self.fig_mem, master=left_pane)
             self.canvas_mem.get_tk_widget().pack(fill='both', expand=True, padx=6, pady=6)
+
+            self._charts = {self.canvas_cpu: (self.ax_cpu, self.cpu_line),
+                            self.canvas_mem: (self.ax_mem, self.mem_line)}
+            self._chart_bg = {}
+            for canvas in self._charts:
+                canvas.mpl_connect('draw_event', self._on_chart_draw)
+                canvas.draw()
         else:
-            lbl_no_mpl = ctk.Label(left_pane, text='Matplotlib not installed — charts unavailable', bg=left_pane['bg'] if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else None, fg='white') if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkLabel(left_pane, text='Matplotlib not installed — charts unavailable')
+            lbl_no_mpl = _Label(left_pane, text='Matplotlib not installed — charts unavailable', **_colors(left_pane, 'white'))
             lbl_no_mpl.pack(padx=6, pady=6)
 
         self.text_report = scrolledtext.ScrolledText(right_pane, wrap='word', font=('Consolas', 10), width=60)
         self.text_report.pack(fill='both', expand=True, padx=6, pady=6)
         self.text_report.configure(state='disabled')
 
-        self.status_var = ctk.StringVar() if (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.StringVar()
-        status_lbl = ctk.Label(self.root, textvariable=self.status_var, anchor='w') if not (USE_CUSTOM and ctk.__name__ == 'customtkinter') else ctk.CTkLabel(self.root, textvariable=self.status_var)
+        self.status_var = ctk.StringVar()
+        # Only the plain Tk label was left-anchored; the CTk one stays centred.
+        status_lbl = _Label(self.root, textvariable=self.status_var, **({} if USE_CUSTOM else {'anchor': 'w'}))
         status_lbl.pack(fill='x')
 
+    def _schedule(self):
+        # Tk's own timer drives auto-refresh; no extra thread is needed to wait.
+        self.root.after(REFRESH_INTERVAL_MS, self._auto_refresh)
+
+    def _auto_refresh(self):
+        self.refresh_async()
+        self._schedule()
+
     def refresh_async(self):
-        t = threading.Thread(target=self._refresh)
+        t = threading.Thread(target=self._collect)
         t.daemon = True
         t.start()
 
-    def _refresh(self):
+    def _collect(self):
+        # Worker thread: gather and format only. Tk is not thread-safe, so all
+        # widget updates are posted to the main loop via _apply.
+        after = self.root.after
+        after(0, self._set_status, 'Collecting system information...')
         try:
-            self._set_status('Collecting system information...')
             data = gather_all()
-            self.latest_text = pretty_report(data)
+            text = pretty_report(data)
+            if psutil:
+                cpu_pct = data.get('cpu', {}).get('total_percent')
+                cpu_pct = cpu_pct if isinstance(cpu_pct, (int, float)) else 0
+                mem_pct = psutil.virtual_memory().percent
+            else:
+                cpu_pct = 0
+                mem_pct = 0
+            self.cpu_history.append(cpu_pct)
+            self.mem_history.append(mem_pct)
+            snapshot = {
+                'data': data,
+                'text': text,
+                'cpu_history': tuple(self.cpu_history),
+                'mem_history': tuple(self.mem_history),
+            }
+        except Exception as e:
+            after(0, self._set_status, f'Error: {e}')
+            return
+        self._latest_snapshot = snapshot
+        after(0, self._apply, snapshot)
+
+    def _apply(self, snapshot):
+        # Main thread: push one collected snapshot into the widgets.
+        data = snapshot['data']
+        try:
             b = data.get('basic', {})
-            self._set_label(self.lbl_user, f"User: {b.get('user')}")
-            self._set_label(self.lbl_host, f"Host: {b.get('hostname')}")
+            self._set_label(self.lbl_user, _fill(LABEL_USER_TMPL, b))
+            self._set_label(self.lbl_host, _fill(LABEL_HOST_TMPL, b))
 
-            cpu = data.get('cpu', {})
-            mem = data.get('memory', {})
             disks = data.get('disks', [])
-            net = data.get('network', {})
-
-            self._set_label(self.card_cpu_val, f"{cpu.get('total_percent')}% ({cpu.get('logical')}c)")
-            self._set_label(self.card_mem_val, f"{mem.get('percent','-')} — {mem.get('used','-')}/{mem.get('total','-')}")
+            self._set_label(self.card_cpu_val, _fill(CARD_CPU_TMPL, data.get('cpu', {})))
+            self._set_label(self.card_mem_val, _fill(CARD_MEM_TMPL, data.get('memory', {})))
             if disks:
-                d = disks[0]
-                self._set_label(self.card_disk_val, f"{d.get('device')} {d.get('used','-')}/{d.get('total','-')}")
+                self._set_label(self.card_disk_val, _fill(CARD_DISK_TMPL, disks[0]))
             else:
                 self._set_label(self.card_disk_val, 'No disk info')
-            self._set_label(self.card_net_val, f"IP: {net.get('local_ip','-')}")
+            self._set_label(self.card_net_val, _fill(CARD_NET_TMPL, data.get('network', {})))
 
-            self._set_report(self.latest_text)
+            self._set_report(snapshot['text'])
             try:
-                if psutil:
-                    cpu_pct = psutil.cpu_percent(interval=0.1)
-                    mem_pct = psutil.virtual_memory().percent
-                else:
-                    cpu_pct = 0
-                    mem_pct = 0
-                self.cpu_history.append(cpu_pct)
-                self.mem_history.append(mem_pct)
-                self.cpu_history = self.cpu_history[-30:]
-                self.mem_history = self.mem_history[-30:]
                 if HAS_MPL:
-                    self.ax_cpu.clear(); self.ax_cpu.plot(self.cpu_history); self.ax_cpu.set_ylim(0,100); self.ax_cpu.set_title('CPU (%) — last samples')
-                    self.canvas_cpu.draw_idle()
-                    self.ax_mem.clear(); self.ax_mem.plot(self.mem_history); self.ax_mem.set_ylim(0,100); self.ax_mem.set_title('Memory (%) — last samples')
-                    self.canvas_mem.draw_idle()
+                    self._blit_line(self.canvas_cpu, snapshot['cpu_history'])
+                    self._blit_line(self.canvas_mem, snapshot['mem_history'])
             except Exception:
                 pass
 
@@ -399,6 +537,24 @@ class DashboardApp:
         except Exception as e:
             self._set_status(f'Error: {e}')
 
+    def _on_chart_draw(self, event):
+        # A full draw (first show, resize) invalidates the cached background.
+        canvas = event.canvas
+        ax, line = self._charts[canvas]
+        self._chart_bg[canvas] = canvas.copy_from_bbox(ax.bbox)
+        ax.draw_artist(line)
+
+    def _blit_line(self, canvas, history):
+        ax, line = self._charts[canvas]
+        line.set_data(range(len(history)), list(history))
+        bg = self._chart_bg.get(canvas)
+        if bg is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(bg)
+        ax.draw_artist(line)
+        canvas.blit(ax.bbox)
+
     def _set_label(self, widget, text):
         try:
             if hasattr(widget, 'configure'):
@@ -412,11 +568,30 @@ class DashboardApp:
                 pass
 
     def _set_report(self, text):
+        # The Text widget re-lays-out whatever it is given, so only rewrite
+        # the blank-line separated sections that differ from the last render.
+        if text == self._last_rendered_text:
+            return
+        sections = text.split('\n\n')
+        prev = self._report_sections
         try:
             self.text_report.configure(state='normal')
-            self.text_report.delete('1.0', 'end')
-            self.text_report.insert('1.0', text)
+            if len(sections) != len(prev):
+                self.text_report.replace('1.0', 'end', text)
+            else:
+                starts = []
+                line = 1
+                for sec in prev:
+                    starts.append(line)
+                    line += sec.count('\n') + 2
+                # Bottom-up, so the line numbers of earlier sections stay valid.
+                for i in reversed(range(len(sections))):
+                    if sections[i] != prev[i]:
+                        last = starts[i] + prev[i].count('\n')
+                        self.text_report.replace(f'{starts[i]}.0', f'{last}.end', sections[i])
             self.text_report.configure(state='disabled')
+            self._last_rendered_text = text
+            self._report_sections = sections
         except Exception:
             pass
 
@@ -424,11 +599,7 @@ class DashboardApp:
         try:
             self.status_var.set(s)
         except Exception:
-            try:
-                if USE_CUSTOM and ctk.__name__ == 'customtkinter':
-                    pass
-            except Exception:
-                pass
+            pass
 
     def export_report(self):
         try:
@@ -436,27 +607,29 @@ class DashboardApp:
             file = filedialog.asksaveasfilename(defaultextension='.txt', initialfile=fname, filetypes=[('Text files','*.txt'),('All','*.*')])
             if not file:
                 return
-            if not self.latest_text:
-                data = gather_all(); self.latest_text = pretty_report(data)
-            with open(file, 'w', encoding='utf-8') as f:
-                f.write(self.latest_text)
-            messagebox.showinfo('Exported', f'Report saved: {file}')
+            # Collecting and writing happen off the UI thread. Not on _POOL:
+            # gather_all() would then wait on its own pool's jobs.
+            t = threading.Thread(target=self._write_report, args=(file, self._latest_snapshot))
+            t.daemon = True
+            t.start()
         except Exception as e:
             messagebox.showerror('Error', f'Export failed: {e}')
 
+    def _write_report(self, file, snapshot):
+        after = self.root.after
+        try:
+            # Reuse the last refresh; only collect if none has finished yet.
+            text = snapshot['text'] if snapshot else pretty_report(gather_all())
+            with open(file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            after(0, messagebox.showinfo, 'Exported', f'Report saved: {file}')
+        except Exception as e:
+            after(0, messagebox.showerror, 'Error', f'Export failed: {e}')
+
 if __name__ == '__main__':
-    if USE_CUSTOM and ctk.__name__ == 'customtkinter':
+    if USE_CUSTOM:
         root = ctk.CTk()
     else:
         root = ctk.Tk()
     app = DashboardApp(root)
-    def periodic_refresh():
-        while True:
-            time.sleep(8)
-            try:
-                app.refresh_async()
-            except Exception:
-                pass
-    t = threading.Thread(target=periodic_refresh, daemon=True)
-    t.start()
     root.mainloop()